@@ -139,7 +139,9 @@ CORS_ALLOW_HEADERS = [
     "sec-websocket-version",
     "sec-websocket-extensions",
     "sec-websocket-key",
+    "idempotency-key",
 ]
+CORS_EXPOSE_HEADERS = ["idempotent-replayed"]
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -218,3 +220,104 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+
+# Recommendation engine
+# Seconds before a worker re-reads a vendor's co-occurrence index from the database
+RECOMMENDATION_INDEX_TTL = 300
+# Scoring backend: 'cooccurrence' (persisted pairwise counts) or 'incidence' (NumPy bit-packed matrix)
+RECOMMENDATION_BACKEND = 'cooccurrence'
+# Cart-keyed recommendation result cache (per worker process). Invalidation uses
+# per-vendor version stamps kept in the default cache; use a shared cache backend
+# (e.g. Redis) in production so every worker sees the bumps.
+RECOMMENDATION_CACHE_MAX_ENTRIES = 10000
+RECOMMENDATION_CACHE_TTL = 300
+# Segment recommendations by hour of day and weekday/weekend, falling back to
+# all orders when a segment has fewer orders, or fewer orders containing the
+# cart, than these minimums
+RECOMMENDATION_SEGMENTS_ENABLED = True
+RECOMMENDATION_SEGMENT_MIN_ORDERS = 50
+RECOMMENDATION_SEGMENT_MIN_SUPPORT = 5
+# Local weekdays treated as the weekend (Monday is 0)
+RECOMMENDATION_WEEKEND_DAYS = (5, 6)
+
+# Menu item popularity
+# Half-life of the exponentially decayed popularity score (stored scores are scaled
+# by it, so run rebuild_popularity after changing it)
+POPULARITY_HALF_LIFE_DAYS = 7
+
+# Menu search
+# Backend for fuzzy search: 'python' (in-memory index, any database), 'mysql'
+# (FULLTEXT index) or 'sqlite' (FTS5); see vendor/search_backends.py
+MENU_SEARCH_BACKEND = 'python'
+# Minimum trigram similarity for a fuzzy search term to match an indexed word
+MENU_SEARCH_MIN_SIMILARITY = 0.3
+# Maximum edits (insertions, deletions, substitutions, transpositions) a fuzzy
+# search word may be away from a menu word; shorter words tolerate fewer
+MENU_SEARCH_MAX_EDIT_DISTANCE = 2
+# Autocomplete suggestions kept per trie node, and seconds before a trie is
+# rebuilt to follow popularity changes
+MENU_AUTOCOMPLETE_MAX_RESULTS = 10
+MENU_AUTOCOMPLETE_TTL = 300
+# Seconds before a vendor's columnar browse snapshot is rebuilt to refresh
+# popularity (menu edits rebuild it immediately)
+MENU_SNAPSHOT_TTL = 60
+
+# Public menu
+# Seconds a built public menu stays cached; menu and profile edits replace it
+# immediately, the TTL only bounds how stale its popular items can get
+PUBLIC_MENU_CACHE_TTL = 300
+# Menus are cached pre-compressed with gzip, and with brotli too when the
+# optional brotli package is installed
+# Static export of public menus to MEDIA_ROOT/menus/<vendor_id>/ for nginx or a
+# CDN to serve (see vendor/menu_export.py); PublicMenuView stays the fallback
+PUBLIC_MENU_EXPORT_ENABLED = False
+# Absolute base for image URLs in exported menus; '' keeps them site-relative
+PUBLIC_MENU_EXPORT_BASE_URL = ''
+# Background publishing threads per worker process, and menu exports kept per vendor
+PUBLIC_MENU_EXPORT_WORKERS = 2
+PUBLIC_MENU_EXPORT_KEEP = 3
+# Menu changes feed: days deletions stay visible (older sync versions must
+# reload the full menu), and seconds each sync re-covers before its version
+MENU_CHANGES_RETENTION_DAYS = 30
+MENU_CHANGES_OVERLAP_SECONDS = 5
+
+# Image derivatives (vendor/images.py): widths rendered as JPEG/PNG and WebP,
+# background rendering threads, and uploads allowed to wait before the rest
+# are left to the generate_image_derivatives backfill
+IMAGE_VARIANT_WIDTHS = {'thumbnail': 320, 'medium': 800}
+IMAGE_PIPELINE_WORKERS = 2
+IMAGE_PIPELINE_MAX_PENDING = 100
+
+# Vendors whose menus each worker keeps in its compact in-memory store
+# (vendor/menu_store.py), least recently used evicted first
+MENU_STORE_MAX_VENDORS = 5000
+# Seconds before a compact menu is rebuilt even if its version has not changed,
+# bounding staleness when menu versions are not in a shared cache
+MENU_STORE_TTL = 300
+
+# Invoice numbers each worker reserves from the invoice sequence at a time
+# (vendor/invoices.py); larger blocks lock the sequence row less often
+INVOICE_BLOCK_SIZE = 100
+
+# Order ingestion (vendor/ingestion.py): 'sync' places orders and notifies the
+# vendor within the request; 'queue' only writes the order and an outbox task
+# and leaves notifications and derived stores to the process_order_queue
+# workers, which must be running. Queue mode also needs CHANNEL_LAYERS and
+# CACHES backends shared between processes (e.g. Redis); with the in-memory
+# channel layer or a LocMemCache the app refuses to start
+ORDER_INGESTION_MODE = 'sync'
+# Queue broker; 'database' keeps tasks in the OrderIngestionTask table
+ORDER_INGESTION_BROKER = 'database'
+ORDER_INGESTION_WORKERS = 4
+# Attempts before a task is marked failed (retries back off exponentially),
+# seconds before a task left 'processing' by a dead worker runs again, and
+# hours finished tasks are kept for lag statistics
+ORDER_INGESTION_MAX_ATTEMPTS = 5
+ORDER_INGESTION_VISIBILITY_TIMEOUT = 300
+ORDER_INGESTION_RETENTION_HOURS = 24
+
+# Idempotency-Key support on order creation and payment initiation
+# (vendor/idempotency.py): hours a key's recorded response is replayed, and
+# seconds before a reservation whose request never finished can be retried
+IDEMPOTENCY_KEY_TTL_HOURS = 24
+IDEMPOTENCY_LOCK_TIMEOUT = 60
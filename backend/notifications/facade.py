@@ -10,9 +10,9 @@ class NotificationFacade:
     def __init__(self):
         self.notification_service = NotificationService()
     
-    def send_new_order_notification(self, vendor: User, order):
+    def send_new_order_notification(self, vendor: User, order, items=None):
         """Send notification for new order"""
-        return self.notification_service.send_new_order_notification(vendor, order)
+        return self.notification_service.send_new_order_notification(vendor, order, items)
     
     def send_order_status_update(self, vendor: User, order, old_status: str, new_status: str):
         """Send notification for order status update"""
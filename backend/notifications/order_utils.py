@@ -5,6 +5,42 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def order_update_data(order):
+    """
+    The WebSocket update payload for an order, built from the instance
+    alone so callers that already hold the order need no extra queries
+    """
+    # Get table identifier
+    table_identifier = None
+    if hasattr(order, 'table_identifier') and order.table_identifier:
+        table_identifier = order.table_identifier
+    elif order.table and order.table.qr_code:
+        table_identifier = order.table.qr_code
+
+    # Format minimal update data - only essential status changes
+    order_data = {
+        "id": order.id,
+        "status": order.status,
+        "updatedAt": order.updated_at.isoformat() if hasattr(order, 'updated_at') else timezone.now().isoformat(),
+        # Add timestamp for debugging
+        "server_timestamp": timezone.now().isoformat(),
+        "message": f"Order {order.id} status is now {order.status}",
+        # Include vendor and table info for proper channel routing
+        "vendor_id": order.vendor_id,
+        "table_identifier": table_identifier,
+        # Include delivery issue fields for real-time updates
+        "delivery_issue_reported": getattr(order, 'delivery_issue_reported', False),
+        "issue_report_timestamp": order.issue_report_timestamp.isoformat() if getattr(order, 'issue_report_timestamp', None) else None,
+        "issue_description": getattr(order, 'issue_description', None),
+        "issue_resolved": getattr(order, 'issue_resolved', False),
+        "issue_resolution_timestamp": order.issue_resolution_timestamp.isoformat() if getattr(order, 'issue_resolution_timestamp', None) else None,
+        "resolution_message": getattr(order, 'resolution_message', None),
+        # Include customer verification fields for real-time updates
+        "customer_verified": getattr(order, 'customer_verified', False),
+        "verification_timestamp": order.verification_timestamp.isoformat() if getattr(order, 'verification_timestamp', None) else None,
+    }
+    return order_data
+
 def send_order_update(order_id, order_data=None):
     """
     Send an order update to all clients tracking this order
@@ -65,35 +101,7 @@ def send_order_update(order_id, order_data=None):
                 table_name = order.table_identifier
             # If no table info available, keep default "Table"
             
-            # Get table identifier
-            table_identifier = None
-            if hasattr(order, 'table_identifier') and order.table_identifier:
-                table_identifier = order.table_identifier
-            elif order.table and order.table.qr_code:
-                table_identifier = order.table.qr_code
-                
-            # Format minimal update data - only essential status changes
-            order_data = {
-                "id": order.id,
-                "status": order.status,
-                "updatedAt": order.updated_at.isoformat() if hasattr(order, 'updated_at') else timezone.now().isoformat(),
-                # Add timestamp for debugging
-                "server_timestamp": timezone.now().isoformat(),
-                "message": f"Order {order.id} status is now {order.status}",
-                # Include vendor and table info for proper channel routing
-                "vendor_id": order.vendor_id,
-                "table_identifier": table_identifier,
-                # Include delivery issue fields for real-time updates
-                "delivery_issue_reported": getattr(order, 'delivery_issue_reported', False),
-                "issue_report_timestamp": order.issue_report_timestamp.isoformat() if getattr(order, 'issue_report_timestamp', None) else None,
-                "issue_description": getattr(order, 'issue_description', None),
-                "issue_resolved": getattr(order, 'issue_resolved', False),
-                "issue_resolution_timestamp": order.issue_resolution_timestamp.isoformat() if getattr(order, 'issue_resolution_timestamp', None) else None,
-                "resolution_message": getattr(order, 'resolution_message', None),
-                # Include customer verification fields for real-time updates
-                "customer_verified": getattr(order, 'customer_verified', False),
-                "verification_timestamp": order.verification_timestamp.isoformat() if getattr(order, 'verification_timestamp', None) else None,
-            }
+            order_data = order_update_data(order)
         
         channel_layer = get_channel_layer()
         
@@ -121,14 +121,24 @@ class NotificationService:
             logger.error(f"Error sending WebSocket notification: {e}")
             logger.exception("Full traceback:")
     
-    def send_new_order_notification(self, vendor, order):
-        """Send new order notification"""
+    def send_new_order_notification(self, vendor, order, items=None):
+        """
+        Send new order notification
+
+        Args:
+            vendor: Vendor to notify
+            order: Order instance or order ID
+            items: Optional order line dicts (name, quantity, price, item_id) from
+                the code that just wrote the order; avoids reading them back
+        """
         # Handle both order object and order_id
         order_id = order.id if hasattr(order, 'id') else order
         
         # Get order items if available
         order_items = []
-        if hasattr(order, 'items'):
+        if items is not None:
+            order_items = list(items)
+        elif hasattr(order, 'items'):
             try:
                 # Use select_related to efficiently fetch related menu_item data
                 items = order.items.all().select_related('menu_item')
@@ -228,8 +238,9 @@ class NotificationService:
         
         # Send WebSocket update for the order
         try:
-            from notifications.order_utils import send_order_update
-            send_order_update(order_id)
+            from notifications.order_utils import order_update_data, send_order_update
+            # An order that was just written is up to date in memory
+            send_order_update(order_id, order_update_data(order) if items is not None else None)
             logger.info(f"Sent WebSocket order update for order #{order_id}")
         except Exception as e:
             logger.error(f"Error sending WebSocket order update for order #{order_id}: {e}")